@@ -30,54 +30,500 @@
 
 import os
 import sys
+import copy
+import math
+import ctypes
 import random
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import pandas as pd
 import datetime as dt
 from time import perf_counter
 import matplotlib.pyplot as plt
 import matplotlib.image as pmimg
+from PIL import Image
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+try:
+    import numexpr as ne
+    HAS_NUMEXPR = True
+except ImportError:
+    HAS_NUMEXPR = False
+
+# hand-vectorized AVX2 Mandelbrot kernel, used when the shared library has
+# been built next to this script (see mandel_avx.c for the one-line build)
+_AVX_LIB = None
+_avx_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'mandel_avx.so')
+if os.path.exists(_avx_path):
+    try:
+        _AVX_LIB = ctypes.CDLL(_avx_path)
+        _AVX_LIB.mandel_avx2_f32.restype = None
+        _AVX_LIB.mandel_avx2_f32.argtypes = [
+            ctypes.POINTER(ctypes.c_float), ctypes.POINTER(ctypes.c_float),
+            ctypes.POINTER(ctypes.c_int64), ctypes.c_int64,
+            ctypes.c_int32, ctypes.c_float]
+    except OSError:
+        _AVX_LIB = None
+HAS_AVX = _AVX_LIB is not None
+
+if HAS_NUMBA:
+    from numba import cuda
+    try:
+        HAS_CUDA = cuda.is_available()
+    except Exception:
+        HAS_CUDA = False
+else:
+    HAS_CUDA = False
+
+if HAS_NUMBA:
+    # explicit signatures compile the kernels at import instead of on the
+    # first render, which dominates wall time for one-shot CLI runs. The
+    # kernels take the grid origin and spacing as scalars and rebuild each
+    # pixel's c in registers - two FMAs beat streaming coordinate arrays
+    # from memory on this bandwidth-bound loop.
+    @njit(['void(float32, float32, float32, float32, float32[:, ::1], int64, float32)',
+           'void(float64, float64, float64, float64, float32[:, ::1], int64, float64)'],
+          parallel=True, fastmath=True, cache=True, boundscheck=False)
+    def mandelbrot_kernel(x0, y0, dx, dy, N, iterations, bound):
+        bound2 = bound * bound
+        for i in prange(N.shape[0]):
+            c_i = y0 + i * dy
+            for j in range(N.shape[1]):
+                c_r = x0 + j * dx
+                # points inside the main cardioid or the period-2 bulb never
+                # escape, so skip the iteration loop entirely
+                xm = c_r - np.float32(0.25)
+                q = xm * xm + c_i * c_i
+                if (q * (q + xm) < np.float32(0.25) * c_i * c_i
+                        or (c_r + 1) * (c_r + 1) + c_i * c_i < np.float32(0.0625)):
+                    N[i, j] = iterations
+                    continue
+                zr = np.float32(0)
+                zi = np.float32(0)
+                # periodicity check: interior orbits settle into a cycle, so
+                # compare against a snapshot taken at doubling intervals and
+                # bail out on a repeat instead of burning the full budget
+                zr_old = zr
+                zi_old = zi
+                period = 1
+                until_snap = 1
+                N[i, j] = iterations
+                for n in range(iterations):
+                    # reuse the squares from the escape test in the update
+                    # (randomascii "faster fractals through algebra")
+                    zr2 = zr * zr
+                    zi2 = zi * zi
+                    if zr2 + zi2 >= bound2:
+                        # smooth (fractional) escape value: removes the
+                        # integer banding without any post-processing pass
+                        N[i, j] = n + 1 - math.log2(0.5 * math.log2(zr2 + zi2))
+                        break
+                    zi = 2 * zr * zi + c_i
+                    zr = zr2 - zi2 + c_r
+                    if zr == zr_old and zi == zi_old:
+                        break
+                    until_snap -= 1
+                    if until_snap == 0:
+                        zr_old = zr
+                        zi_old = zi
+                        period = min(period * 2, 32)
+                        until_snap = period
+
+    @njit(['void(float32, float32, float32, float32, float32[:, ::1], float32, float32, int64, float32)',
+           'void(float64, float64, float64, float64, float32[:, ::1], float64, float64, int64, float64)'],
+          parallel=True, fastmath=True, cache=True, boundscheck=False)
+    def julia_kernel(x0, y0, dx, dy, N, c_r, c_i, iterations, bound):
+        bound2 = bound * bound
+        for i in prange(N.shape[0]):
+            zi0 = y0 + i * dy
+            for j in range(N.shape[1]):
+                zr = x0 + j * dx
+                zi = zi0
+                zr_old = zr
+                zi_old = zi
+                period = 1
+                until_snap = 1
+                N[i, j] = iterations
+                for n in range(iterations):
+                    zr2 = zr * zr
+                    zi2 = zi * zi
+                    if zr2 + zi2 >= bound2:
+                        N[i, j] = n + 1 - math.log2(0.5 * math.log2(zr2 + zi2))
+                        break
+                    zi = 2 * zr * zi + c_i
+                    zr = zr2 - zi2 + c_r
+                    if zr == zr_old and zi == zi_old:
+                        break
+                    until_snap -= 1
+                    if until_snap == 0:
+                        zr_old = zr
+                        zi_old = zi
+                        period = min(period * 2, 32)
+                        until_snap = period
+
+    @njit(['void(float32, float32, float32, float32, float32[:, ::1], int64, float32)',
+           'void(float64, float64, float64, float64, float32[:, ::1], int64, float64)'],
+          parallel=True, fastmath=True, cache=True, boundscheck=False)
+    def burning_ship_kernel(x0, y0, dx, dy, N, iterations, bound):
+        # (|zr| + |zi|i)**2 + c in real arithmetic: the cross term is
+        # 2*|zr|*|zi| == 2*|zr*zi| and the squares lose the signs anyway
+        bound2 = bound * bound
+        for i in prange(N.shape[0]):
+            c_i = y0 + i * dy
+            for j in range(N.shape[1]):
+                c_r = x0 + j * dx
+                zr = np.float32(0)
+                zi = np.float32(0)
+                zr_old = zr
+                zi_old = zi
+                period = 1
+                until_snap = 1
+                N[i, j] = iterations
+                for n in range(iterations):
+                    zr2 = zr * zr
+                    zi2 = zi * zi
+                    if zr2 + zi2 >= bound2:
+                        N[i, j] = n + 1 - math.log2(0.5 * math.log2(zr2 + zi2))
+                        break
+                    zi = 2 * abs(zr * zi) + c_i
+                    zr = zr2 - zi2 + c_r
+                    if zr == zr_old and zi == zi_old:
+                        break
+                    until_snap -= 1
+                    if until_snap == 0:
+                        zr_old = zr
+                        zi_old = zi
+                        period = min(period * 2, 32)
+                        until_snap = period
+
+if HAS_CUDA:
+    # like the CPU kernels, each thread rebuilds its pixel's c from the
+    # grid origin/spacing scalars - nothing but N crosses the PCIe bus
+    @cuda.jit
+    def mandelbrot_cuda(x0, y0, dx, dy, N, iterations, bound2):
+        i, j = cuda.grid(2)
+        if i < N.shape[0] and j < N.shape[1]:
+            c_r = x0 + j * dx
+            c_i = y0 + i * dy
+            zr = np.float32(0)
+            zi = np.float32(0)
+            N[i, j] = iterations
+            for n in range(iterations):
+                zr2 = zr * zr
+                zi2 = zi * zi
+                if zr2 + zi2 >= bound2:
+                    N[i, j] = n + 1 - math.log2(0.5 * math.log2(zr2 + zi2))
+                    return
+                zi = 2 * zr * zi + c_i
+                zr = zr2 - zi2 + c_r
+
+    @cuda.jit
+    def julia_cuda(x0, y0, dx, dy, N, c_r, c_i, iterations, bound2):
+        i, j = cuda.grid(2)
+        if i < N.shape[0] and j < N.shape[1]:
+            zr = x0 + j * dx
+            zi = y0 + i * dy
+            N[i, j] = iterations
+            for n in range(iterations):
+                zr2 = zr * zr
+                zi2 = zi * zi
+                if zr2 + zi2 >= bound2:
+                    N[i, j] = n + 1 - math.log2(0.5 * math.log2(zr2 + zi2))
+                    return
+                zi = 2 * zr * zi + c_i
+                zr = zr2 - zi2 + c_r
+
+    @cuda.jit
+    def burning_ship_cuda(x0, y0, dx, dy, N, iterations, bound2):
+        i, j = cuda.grid(2)
+        if i < N.shape[0] and j < N.shape[1]:
+            c_r = x0 + j * dx
+            c_i = y0 + i * dy
+            zr = np.float32(0)
+            zi = np.float32(0)
+            N[i, j] = iterations
+            for n in range(iterations):
+                zr2 = zr * zr
+                zi2 = zi * zi
+                if zr2 + zi2 >= bound2:
+                    N[i, j] = n + 1 - math.log2(0.5 * math.log2(zr2 + zi2))
+                    return
+                zi = 2 * abs(zr * zi) + c_i
+                zr = zr2 - zi2 + c_r
+
+    def _run_cuda(kernel, x0, y0, dx, dy, yn, xn, iterations, bound, extra=()):
+        """Launch an escape-time kernel with one thread per pixel"""
+        d_N = cuda.device_array((yn, xn), dtype=np.float32)
+        blockdim = (16, 16)
+        griddim = ((yn + blockdim[0] - 1) // blockdim[0],
+                   (xn + blockdim[1] - 1) // blockdim[1])
+        kernel[griddim, blockdim](x0, y0, dx, dy, d_N,
+                                  *extra, iterations, np.float32(bound * bound))
+        return d_N.copy_to_host()
+
+# most recent coordinate grids, keyed by view, so zoom/animation sweeps
+# that re-render the same window do not rebuild them
+_grid_cache = {}
+_GRID_CACHE_SIZE = 8
+
+def complex_grid(fract_params, xn, yn):
+    """Return real and imaginary parts of the complex plane as real grids
+
+    Precision follows _coord_dtype: float32 at ordinary zooms, where it
+    resolves the pixel spacing fine and halves memory traffic versus
+    double/complex128, promoting to float64 on deep zooms. Grids are
+    cached per view; callers get copies since the fallback path mutates
+    them in place.
+    """
+    dtype = _coord_dtype(fract_params, xn, yn)
+    key = (fract_params.xmin, fract_params.xmax,
+           fract_params.ymin, fract_params.ymax, xn, yn, dtype)
+    if key not in _grid_cache:
+        X = np.linspace(fract_params.xmin, fract_params.xmax, xn).astype(dtype)
+        Y = np.linspace(fract_params.ymin, fract_params.ymax, yn).astype(dtype)
+        _grid_cache[key] = (np.broadcast_to(X, (yn, xn)).copy(),
+                            np.broadcast_to(Y[:, None], (yn, xn)).copy())
+        while len(_grid_cache) > _GRID_CACHE_SIZE:
+            _grid_cache.pop(next(iter(_grid_cache)))
+    cr, ci = _grid_cache[key]
+    return cr.copy(), ci.copy()
+
+def _count_dtype(iterations):
+    """Smallest integer dtype that holds the escape count
+
+    N is pure bandwidth on every pass that touches it, so a uint8/int16
+    counter beats the 8 B/pixel of the platform default int.
+    """
+    if iterations <= 255:
+        return np.uint8
+    if iterations <= 32767:
+        return np.int16
+    return np.int32
+
+# tile edge for the fallback: four 256x256 float32 tiles total ~1 MB, so a
+# tile's whole working set stays in L2 across its full iteration budget
+TILE = 256
+
+def _iterate_tile(zr, zi, cr, ci, N, iterations, bound2, ship):
+    """Run the full iteration budget over one flat, contiguous tile
+
+    With numexpr available each iteration is three fused, multi-threaded
+    passes. Otherwise the tile runs dense full-grid ufunc passes while
+    most pixels are alive (gather/scatter on a nearly-full set is pure
+    overhead), then switches to a shrinking int32 index list of survivors
+    once under half the tile is still iterating.
+    """
+    zi_expr = '2 * abs(zr * zi) + ci' if ship else '2 * zr * zi + ci'
+    if HAS_NUMEXPR:
+        new_zr = np.empty_like(zr)
+        mag2 = np.empty_like(zr)
+        # numexpr arithmetic is int32 at narrowest; count there and narrow
+        # on the way out
+        N32 = N.astype(np.int32)
+        for n in range(iterations):
+            # one magnitude pass feeds both the count and the early-out
+            ne.evaluate('zr * zr + zi * zi', out=mag2)
+            ne.evaluate('where(mag2 < bound2, N32 + 1, N32)', out=N32)
+            # every 8th iteration, stop if every pixel has escaped
+            if n % 8 == 7 and not int(
+                    ne.evaluate('sum(where(mag2 < bound2, 1, 0))')):
+                break
+            ne.evaluate('zr * zr - zi * zi + cr', out=new_zr)
+            ne.evaluate(zi_expr, out=zi)
+            zr, new_zr = new_zr, zr
+        N[:] = N32
+        return N
+    # mask and magnitude buffers are allocated once and sliced to the
+    # shrinking active size, instead of a fresh bool array per iteration
+    mag_buf = np.empty(N.size, dtype=zr.dtype)
+    alive_buf = np.empty(N.size, dtype=bool)
+    zr2 = np.empty_like(zr)
+    zi2 = np.empty_like(zr)
+    tmp = np.empty_like(zr)
+    n = 0
+    with np.errstate(over='ignore', invalid='ignore'):
+        # dense phase: whole-tile passes, no gather/scatter
+        while n < iterations:
+            np.multiply(zr, zr, out=zr2)
+            np.multiply(zi, zi, out=zi2)
+            np.add(zr2, zi2, out=mag_buf)
+            np.less(mag_buf, bound2, out=alive_buf)
+            N += alive_buf
+            np.multiply(zr, zi, out=tmp)
+            if ship:
+                np.abs(tmp, out=tmp)
+            np.multiply(tmp, 2, out=tmp)
+            np.add(tmp, ci, out=zi)
+            np.subtract(zr2, zi2, out=zr)
+            np.add(zr, cr, out=zr)
+            n += 1
+            if n % 8 == 0:
+                count = int(np.count_nonzero(alive_buf))
+                if count == 0:
+                    return N
+                if count < alive_buf.size // 2:
+                    break
+        active = np.flatnonzero(alive_buf).astype(np.int32)
+        # compacted phase: only survivors move bytes from here on
+        for n in range(n, iterations):
+            a = zr[active]
+            b = zi[active]
+            a2 = a * a
+            b2 = b * b
+            mag2 = mag_buf[:active.size]
+            alive = alive_buf[:active.size]
+            np.add(a2, b2, out=mag2)
+            np.less(mag2, bound2, out=alive)
+            active = active[alive]
+            if active.size == 0:
+                break
+            N[active] += 1
+            ab = a[alive] * b[alive]
+            if ship:
+                # |zr|*|zi| == |zr*zi| so one abs covers both
+                np.abs(ab, out=ab)
+            zi[active] = 2 * ab + ci[active]
+            zr[active] = a2[alive] - b2[alive] + cr[active]
+    return N
+
+def _iterate_grid(zr, zi, cr, ci, N, iterations, bound, ship=False):
+    """Iterate z <- z**2 + c, counting survivors in N (NumPy fallback)
+
+    The grid is processed in cache-sized tiles, running all iterations on
+    a tile before moving to the next so z and c are reused from cache
+    instead of streamed from DRAM once per iteration.
+    """
+    bound2 = zr.dtype.type(bound * bound)
+    for ti in range(0, N.shape[0], TILE):
+        for tj in range(0, N.shape[1], TILE):
+            s = (slice(ti, ti + TILE), slice(tj, tj + TILE))
+            tile_N = _iterate_tile(
+                zr[s].ravel(), zi[s].ravel(), cr[s].ravel(), ci[s].ravel(),
+                N[s].ravel(), iterations, bound2, ship)
+            N[s] = tile_N.reshape(N[s].shape)
+    return N
+
+def _coord_dtype(fract_params, xn, yn):
+    """float32 normally, float64 once the pixel spacing nears float32 eps
+
+    At the default zoom float32 resolves the spacing with headroom to
+    spare; past roughly 1e-5 per pixel the quantization becomes visible,
+    so deep zooms promote to double.
+    """
+    dx = abs(fract_params.xmax - fract_params.xmin) / max(xn - 1, 1)
+    dy = abs(fract_params.ymax - fract_params.ymin) / max(yn - 1, 1)
+    return np.float64 if min(dx, dy) < 1e-5 else np.float32
+
+def _grid_steps(fract_params, xn, yn):
+    """Return the grid origin and spacing as scalars
+
+    The compiled CPU kernels rebuild each pixel's coordinates from these
+    in registers, so no coordinate arrays are allocated at all. Spacing
+    matches np.linspace with endpoints included; precision follows
+    _coord_dtype.
+    """
+    dtype = _coord_dtype(fract_params, xn, yn)
+    dx = (fract_params.xmax - fract_params.xmin) / max(xn - 1, 1)
+    dy = (fract_params.ymax - fract_params.ymin) / max(yn - 1, 1)
+    return (dtype(fract_params.xmin), dtype(fract_params.ymin),
+            dtype(dx), dtype(dy))
 
 def in_julia_set(fract_params, xn, yn, iterations=100, bound=2):
     """Return Julia set matrix"""
-    X = np.linspace(fract_params.xmin, fract_params.xmax, xn).astype(np.float32)
-    Y = np.linspace(fract_params.ymin, fract_params.ymax, yn).astype(np.float32)
-    Z = X + Y[:, None] * 1j
-    N = np.zeros_like(Z, dtype=int)
-    C = np.ones_like(Z, dtype=np.cdouble) * fract_params.c
-    for n in range(iterations):
-        I = abs(Z) < bound
-        N[I] = n
-        Z[I] = Z[I]**2 + C[I]
-    return N
+    if HAS_CUDA:
+        x0, y0, dx, dy = _grid_steps(fract_params, xn, yn)
+        return _run_cuda(julia_cuda, x0, y0, dx, dy, yn, xn, iterations, bound,
+                         extra=(np.float32(fract_params.c.real),
+                                np.float32(fract_params.c.imag)))
+    if HAS_NUMBA:
+        x0, y0, dx, dy = _grid_steps(fract_params, xn, yn)
+        N = np.zeros((yn, xn), dtype=np.float32)
+        cast = x0.dtype.type
+        julia_kernel(x0, y0, dx, dy, N, cast(fract_params.c.real),
+                     cast(fract_params.c.imag), iterations, cast(bound))
+        return N
+    zr, zi = complex_grid(fract_params, xn, yn)
+    N = np.zeros((yn, xn), dtype=_count_dtype(iterations))
+    cr = np.full((yn, xn), fract_params.c.real, dtype=zr.dtype)
+    ci = np.full((yn, xn), fract_params.c.imag, dtype=zr.dtype)
+    return _iterate_grid(zr, zi, cr, ci, N, iterations, bound)
 
 def in_burning_ship_set(fract_params, xn, yn, iterations=100, bound=2):
-    """Return Mandelbrot set matrix"""
-    X = np.linspace(fract_params.xmin, fract_params.xmax, xn).astype(np.float32)
-    Y = np.linspace(fract_params.ymin, fract_params.ymax, yn).astype(np.float32)
-    C = X + Y[:, None] * 1j
-    N = np.zeros_like(C, dtype=int)
-    Z = np.zeros_like(C)
-    for n in range(iterations):
-        I = abs(Z) < bound
-        N[I] = n
-        Z[I] = (np.abs(Z[I].real) + np.abs(Z[I].imag) * 1j)**2 + C[I]
-        # Z[I] = (Z[I].real + np.abs(Z[I].imag) * 1j)**2 + C[I]
-    return N
+    """Return Burning Ship set matrix"""
+    if HAS_CUDA:
+        x0, y0, dx, dy = _grid_steps(fract_params, xn, yn)
+        return _run_cuda(burning_ship_cuda, x0, y0, dx, dy, yn, xn, iterations, bound)
+    if HAS_NUMBA:
+        x0, y0, dx, dy = _grid_steps(fract_params, xn, yn)
+        N = np.zeros((yn, xn), dtype=np.float32)
+        burning_ship_kernel(x0, y0, dx, dy, N, iterations, x0.dtype.type(bound))
+        return N
+    cr, ci = complex_grid(fract_params, xn, yn)
+    N = np.zeros((yn, xn), dtype=_count_dtype(iterations))
+    zr = np.zeros((yn, xn), dtype=cr.dtype)
+    zi = np.zeros((yn, xn), dtype=cr.dtype)
+    return _iterate_grid(zr, zi, cr, ci, N, iterations, bound, ship=True)
 
 def in_mandelbrot_set(fract_params, xn, yn, iterations=100, bound=2):
-    """Return Burning Ship set matrix"""
-    X = np.linspace(fract_params.xmin, fract_params.xmax, xn).astype(np.float32)
-    Y = np.linspace(fract_params.ymin, fract_params.ymax, yn).astype(np.float32)
-    C = X + Y[:, None] * 1j
-    N = np.zeros_like(C, dtype=int)
-    Z = np.zeros_like(C)
-    for n in range(iterations):
-        I = abs(Z) < bound
-        N[I] = n
-        Z[I] = Z[I]**2 + C[I]
-    return N
+    """Return Mandelbrot set matrix"""
+    if HAS_CUDA:
+        x0, y0, dx, dy = _grid_steps(fract_params, xn, yn)
+        return _run_cuda(mandelbrot_cuda, x0, y0, dx, dy, yn, xn, iterations, bound)
+    if HAS_NUMBA:
+        x0, y0, dx, dy = _grid_steps(fract_params, xn, yn)
+        N = np.zeros((yn, xn), dtype=np.float32)
+        mandelbrot_kernel(x0, y0, dx, dy, N, iterations, x0.dtype.type(bound))
+        return N
+    cr, ci = complex_grid(fract_params, xn, yn)
+    N = np.zeros((yn, xn), dtype=_count_dtype(iterations))
+    if HAS_AVX and cr.dtype == np.float32:
+        # the C kernel is float32-only; deep zooms promoted to float64
+        # fall through to the dtype-aware fallback below
+        cr = np.ascontiguousarray(cr)
+        ci = np.ascontiguousarray(ci)
+        # the C kernel writes int64 counts; narrow on the way out
+        N64 = np.zeros((yn, xn), dtype=np.int64)
+        _AVX_LIB.mandel_avx2_f32(
+            cr.ctypes.data_as(ctypes.POINTER(ctypes.c_float)),
+            ci.ctypes.data_as(ctypes.POINTER(ctypes.c_float)),
+            N64.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
+            N64.size, iterations, np.float32(bound * bound))
+        return N64.astype(N.dtype)
+    zr = np.zeros((yn, xn), dtype=cr.dtype)
+    zi = np.zeros((yn, xn), dtype=cr.dtype)
+    return _iterate_grid(zr, zi, cr, ci, N, iterations, bound)
+
+def _compute_band(args):
+    """Compute one horizontal band of the image (runs in a worker process)"""
+    fractal_func, band_params, xn, yn, iterations, bound = args
+    return fractal_func(band_params, xn, yn, iterations, bound)
+
+def compute_banded(fractal_func, fract_params, xn, yn, iterations=100, bound=2):
+    """Split the image into row bands and compute them in parallel processes
+
+    Pure-CPython parallelism for installs without numba (whose prange
+    kernels already use every core). Band edges are taken from the same
+    linspace the single-process path would use, so the stitched result is
+    identical.
+    """
+    n_workers = os.cpu_count() or 1
+    Y = np.linspace(fract_params.ymin, fract_params.ymax, yn)
+    jobs = []
+    for rows in np.array_split(np.arange(yn), n_workers):
+        if rows.size == 0:
+            continue
+        band = copy.copy(fract_params)
+        band.ymin = float(Y[rows[0]])
+        band.ymax = float(Y[rows[-1]])
+        jobs.append((fractal_func, band, xn, rows.size, iterations, bound))
+    with ProcessPoolExecutor(max_workers=len(jobs)) as ex:
+        return np.vstack(list(ex.map(_compute_band, jobs)))
 
 class Fract_Params():
     """Holds fractal parameters"""
@@ -90,7 +536,7 @@ class Fract_Params():
         self.c = 0
         self.z = 0
         self.color_map = 'Blues'
-        self.interpolation = 'bilinear'
+        self.interpolation = 'nearest'
         self.save_fig = False
         self.cwd = os.getcwd()
 
@@ -137,7 +583,11 @@ def gen_fractal(fract_params, iterations=100, bound=2):
         fractal_func = in_burning_ship_set
 
     t0 = perf_counter()
-    N = fractal_func(fract_params, xn=1024, yn=1024)
+    if HAS_NUMBA:
+        N = fractal_func(fract_params, xn=1024, yn=1024)
+    else:
+        # no compiled kernels, so parallelize across processes instead
+        N = compute_banded(fractal_func, fract_params, xn=1024, yn=1024)
     t1 = perf_counter()
     tot_time = round(t1-t0, 3)
     print('Total time:', tot_time, 'seconds')
@@ -150,11 +600,15 @@ def gen_fractal(fract_params, iterations=100, bound=2):
     if fract_params.save_fig:
         unique_save = dt.datetime.today().strftime('%m%d%Y-%H%M%S')
         save_path = os.path.join(fract_params.cwd, f'{fract_params.fract_name}_{unique_save}.png')
-        plt.savefig(save_path, dpi=340, format='png', bbox_inches='tight')
+        # colormap the counts directly and let PIL write the file - far
+        # cheaper than rasterizing the figure through savefig's Agg/bbox
+        # pipeline at high dpi
+        top = float(N.max())
+        norm = N.astype(np.float32) / (top if top else 1.0)
+        rgba = (plt.get_cmap(fract_params.color_map)(norm) * 255).astype(np.uint8)
+        Image.fromarray(rgba).save(save_path, format='PNG')
         print('Saved to:', save_path)
-        plt.show()
-    else:
-        plt.show()
+    plt.show()
 
 parser = argparse.ArgumentParser()
 parser.add_argument('-f', '--fractal', help='Fractal type', nargs='?', const='random')
@@ -195,7 +649,7 @@ else:
 if args.interpolation is not None:
     fract_params.interpolation = args.interpolation
 else:
-    fract_params.interpolation = 'bilinear'
+    fract_params.interpolation = 'nearest'
 
 # set min/max x/y values using center point and with
 center_p = complex(args.center_point[0], args.center_point[1])